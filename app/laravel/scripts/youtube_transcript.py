@@ -9,17 +9,19 @@ import sys
 import json
 import re
 
+# Compiled once at import rather than on every call
+VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+VIDEO_URL_PATTERNS = (
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})'),
+)
+
 def extract_video_id(url_or_id):
     """Extract video ID from various YouTube URL formats"""
-    if len(url_or_id) == 11 and re.match(r'^[a-zA-Z0-9_-]+$', url_or_id):
+    if len(url_or_id) == 11 and VIDEO_ID_RE.match(url_or_id):
         return url_or_id
     
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
+    for pattern in VIDEO_URL_PATTERNS:
+        match = pattern.search(url_or_id)
         if match:
             return match.group(1)
     
@@ -2,12 +2,10 @@
 from flask import Flask, request, jsonify
 import os
 import requests
-import json
 import logging
 import subprocess
+import wave
 from datetime import datetime
-import tempfile
-import uuid
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +20,13 @@ S3_JOBS_DIR = os.path.join(S3_BASE_DIR, 'jobs')
 
 # Get environment variables
 LARAVEL_API_URL = os.environ.get('LARAVEL_API_URL', 'http://laravel/api')
+LARAVEL_HELLO_URL = f"{LARAVEL_API_URL}/hello"
+
+# Short timeout so an unreachable Laravel fails the probe fast instead of hanging
+CONNECTIVITY_TIMEOUT = 2
+
+# Reuse pooled keep-alive connections for all calls to Laravel
+HTTP_SESSION = requests.Session()
 
 # Ensure base directory exists
 os.makedirs(S3_JOBS_DIR, exist_ok=True)
@@ -40,7 +45,9 @@ def convert_to_wav(input_path, output_path):
             "-ac", "1",  # Mono
             str(output_path)
         ]
-        logger.debug(f"FFmpeg command: {' '.join(command)}")
+        # Only build the command string when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"FFmpeg command: {' '.join(command)}")
         result = subprocess.run(command, capture_output=True, text=True)
         
         if result.returncode != 0:
@@ -54,7 +61,14 @@ def convert_to_wav(input_path, output_path):
         raise
 
 def get_audio_duration(audio_path):
-    """Get audio duration using ffprobe."""
+    """Get audio duration from the WAV header, falling back to ffprobe."""
+    # The PCM WAV written by convert_to_wav can be read in-process without spawning ffprobe
+    try:
+        with wave.open(str(audio_path), 'rb') as wav_file:
+            return wav_file.getnframes() / float(wav_file.getframerate())
+    except (wave.Error, EOFError, OSError) as e:
+        logger.info(f"Could not read WAV header, falling back to ffprobe: {str(e)}")
+    
     try:
         command = [
             "ffprobe", 
@@ -89,7 +103,7 @@ def update_job_status(job_id, status, response_data=None, error_message=None):
             'completed_at': datetime.now().isoformat() if status in ['completed', 'failed'] else None
         }
         
-        response = requests.post(url, json=payload)
+        response = HTTP_SESSION.post(url, json=payload)
         
         if response.status_code != 200:
             logger.error(f"Failed to update job status in Laravel: {response.text}")
@@ -127,7 +141,7 @@ def connectivity_test():
 def test_laravel_connectivity():
     """Test connectivity to Laravel API."""
     try:
-        response = requests.get(f"{LARAVEL_API_URL}/hello")
+        response = HTTP_SESSION.get(LARAVEL_HELLO_URL, timeout=CONNECTIVITY_TIMEOUT)
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Error connecting to Laravel API: {str(e)}")
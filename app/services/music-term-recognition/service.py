@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 from flask import Flask, request, jsonify
 import os
-import re
 import requests
 import json
 import logging
 from datetime import datetime
 import spacy
 from spacy.matcher import PhraseMatcher
-from pathlib import Path
+
+# Prefer orjson for the music terms JSON; fall back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -23,10 +27,22 @@ S3_JOBS_DIR = os.path.join(S3_BASE_DIR, 'jobs')
 
 # Get environment variables
 LARAVEL_API_URL = os.environ.get('LARAVEL_API_URL', 'http://laravel/api')
+LARAVEL_HELLO_URL = f"{LARAVEL_API_URL}/hello"
+MUSIC_TERMS_EXPORT_URL = f"{LARAVEL_API_URL}/admin/music-terms/export"
+
+# Request timeouts (seconds) so an unreachable Laravel fails fast instead of hanging
+CONNECTIVITY_TIMEOUT = 2
+MUSIC_TERMS_TIMEOUT = 10
+
+# Reuse pooled keep-alive connections for all calls to Laravel
+HTTP_SESSION = requests.Session()
 
 # Ensure base directory exists
 os.makedirs(S3_JOBS_DIR, exist_ok=True)
 
+# Pipeline components the phrase matcher doesn't use, skipped at load time
+SPACY_UNUSED_COMPONENTS = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
 # Fallback music terms in case API is not available
 FALLBACK_MUSIC_TERMS = {
     "guitar_techniques": [
@@ -47,10 +63,9 @@ FALLBACK_MUSIC_TERMS = {
 def fetch_music_terms_from_api():
     """Fetch music terms from the Laravel API."""
     try:
-        url = f"{LARAVEL_API_URL}/admin/music-terms/export"
-        logger.info(f"Fetching music terms from API: {url}")
+        logger.info(f"Fetching music terms from API: {MUSIC_TERMS_EXPORT_URL}")
         
-        response = requests.get(url)
+        response = HTTP_SESSION.get(MUSIC_TERMS_EXPORT_URL, timeout=MUSIC_TERMS_TIMEOUT)
         
         if response.status_code == 200:
             music_terms = response.json()
@@ -65,25 +80,31 @@ def fetch_music_terms_from_api():
         logger.warning("Using fallback music terms")
         return FALLBACK_MUSIC_TERMS
 
+def build_matcher(nlp, music_terms):
+    """Build a phrase matcher for the given music terms."""
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    
+    # Add patterns for each category
+    for category, terms in music_terms.items():
+        # Tokenize all terms for the category in one batch
+        patterns = list(nlp.tokenizer.pipe(terms))
+        if patterns:  # Only add if there are patterns
+            matcher.add(category, None, *patterns)
+    
+    return matcher
+
 # Load and prepare Spacy model for music term recognition
 def load_spacy_model():
     """Load and prepare spaCy model with music terminology patterns."""
     try:
-        # Load smaller model for efficiency
-        nlp = spacy.load("en_core_web_sm")
-        
-        # Create phrase matcher
-        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        # Load smaller model for efficiency; phrase matching only needs the tokenizer
+        nlp = spacy.load("en_core_web_sm", exclude=SPACY_UNUSED_COMPONENTS)
         
         # Fetch music terms from API
         music_terms = fetch_music_terms_from_api()
         
-        # Add patterns for each category
-        for category, terms in music_terms.items():
-            # Create patterns for each term
-            patterns = [nlp.make_doc(term) for term in terms]
-            if patterns:  # Only add if there are patterns
-                matcher.add(category, None, *patterns)
+        # Create phrase matcher
+        matcher = build_matcher(nlp, music_terms)
         
         logger.info("Successfully loaded spaCy model with music term patterns")
         return nlp, matcher, music_terms
@@ -104,18 +125,13 @@ def refresh_music_terms():
         # Fetch fresh terms
         fresh_terms = fetch_music_terms_from_api()
         
-        # Create a new matcher
-        new_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-        
-        # Add patterns for each category
-        for category, terms in fresh_terms.items():
-            # Create patterns for each term
-            patterns = [nlp.make_doc(term) for term in terms]
-            if patterns:  # Only add if there are patterns
-                new_matcher.add(category, None, *patterns)
+        # Reuse the current matcher when the terms have not changed
+        if fresh_terms == MUSIC_TERMS:
+            logger.info("Music terms unchanged, keeping existing matcher")
+            return True
         
         # Update the global variables
-        matcher = new_matcher
+        matcher = build_matcher(nlp, fresh_terms)
         MUSIC_TERMS = fresh_terms
         
         logger.info("Successfully refreshed music terms from API")
@@ -127,32 +143,38 @@ def refresh_music_terms():
 
 def extract_music_terms(transcript_text):
     """Extract music-related terms from transcript text."""
-    # Process the transcript text with spaCy
-    doc = nlp(transcript_text)
-    
-    # Find matches using the phrase matcher
-    matches = matcher(doc)
-    
-    # Structure to store results
+    # Structure to store results, with an empty list for each category
     results = {
         "total_terms": 0,
-        "terms_by_category": {},
+        "terms_by_category": {category: [] for category in MUSIC_TERMS},
         "term_instances": []
     }
     
-    # Initialize counters for each category
-    for category in MUSIC_TERMS.keys():
-        results["terms_by_category"][category] = []
+    # Nothing to match in an empty or silent transcript
+    if not transcript_text.strip():
+        return results
+    
+    # Tokenize only; the LOWER phrase matcher doesn't need tags, parses or entities
+    doc = nlp.make_doc(transcript_text)
+    
+    # Find matches using the phrase matcher
+    matches = matcher(doc)
+    
+    # Track (category, term) pairs already recorded for O(1) duplicate checks
+    seen_terms = set()
     
     # Process matches
+    doc_length = len(doc)
     for match_id, start, end in matches:
         # Get the matched text and its category
         match_text = doc[start:end].text
         category = nlp.vocab.strings[match_id]
         
         # Add to category list if not already present
-        if match_text not in results["terms_by_category"][category]:
+        if (category, match_text) not in seen_terms:
+            seen_terms.add((category, match_text))
             results["terms_by_category"][category].append(match_text)
+            results["total_terms"] += 1
         
         # Add instance with position information
         results["term_instances"].append({
@@ -162,14 +184,21 @@ def extract_music_terms(transcript_text):
                 "start": start,
                 "end": end
             },
-            "context": doc[max(0, start-5):min(len(doc), end+5)].text
+            "context": doc[max(0, start-5):min(doc_length, end+5)].text
         })
     
-    # Update total count
-    results["total_terms"] = sum(len(terms) for terms in results["terms_by_category"].values())
-    
     return results
 
+def save_json(data, file_path):
+    """Save data as pretty-printed JSON."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    logger.info(f"JSON saved to: {file_path}")
+
 def update_job_status(job_id, status, response_data=None, error_message=None):
     """Update the job status in Laravel."""
     try:
@@ -183,7 +212,7 @@ def update_job_status(job_id, status, response_data=None, error_message=None):
             'completed_at': datetime.now().isoformat() if status in ['completed', 'failed'] else None
         }
         
-        response = requests.post(url, json=payload)
+        response = HTTP_SESSION.post(url, json=payload)
         
         if response.status_code != 200:
             logger.error(f"Failed to update job status in Laravel: {response.text}")
@@ -221,7 +250,7 @@ def connectivity_test():
 def test_laravel_connectivity():
     """Test connectivity to Laravel API."""
     try:
-        response = requests.get(f"{LARAVEL_API_URL}/hello")
+        response = HTTP_SESSION.get(LARAVEL_HELLO_URL, timeout=CONNECTIVITY_TIMEOUT)
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Error connecting to Laravel API: {str(e)}")
@@ -291,8 +320,7 @@ def process_transcript():
         music_terms_result = extract_music_terms(transcript_text)
         
         # Save the results to a JSON file
-        with open(music_terms_json_path, 'w', encoding='utf-8') as f:
-            json.dump(music_terms_result, f, indent=2)
+        save_json(music_terms_result, music_terms_json_path)
         
         # Prepare response data
         response_data = {
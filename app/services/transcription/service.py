@@ -1,16 +1,13 @@
 #!/usr/bin/env python3
 import warnings
+import numpy as np
 import torch
 from flask import Flask, request, jsonify
 import os
 import requests
 import json
 import logging
-import subprocess
 from datetime import datetime
-import tempfile
-import uuid
-from pathlib import Path
 
 # Suppress specific warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -26,8 +23,12 @@ else:
 # Import Whisper for transcription
 import whisper
 from functools import lru_cache
-import re
-from typing import Dict, List, Union, Optional, Any
+
+# Prefer orjson for the large transcript JSON; fall back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -42,6 +43,13 @@ S3_JOBS_DIR = os.path.join(S3_BASE_DIR, 'jobs')
 
 # Get environment variables
 LARAVEL_API_URL = os.environ.get('LARAVEL_API_URL', 'http://laravel/api')
+LARAVEL_HELLO_URL = f"{LARAVEL_API_URL}/hello"
+
+# Short timeout so an unreachable Laravel fails the probe fast instead of hanging
+CONNECTIVITY_TIMEOUT = 2
+
+# Reuse pooled keep-alive connections for all calls to Laravel
+HTTP_SESSION = requests.Session()
 
 # Ensure base directory exists
 os.makedirs(S3_JOBS_DIR, exist_ok=True)
@@ -55,20 +63,22 @@ def load_whisper_model(model_name="base"):
 
 def calculate_confidence(segments):
     """Calculate the overall confidence score for a transcription."""
-    probabilities = []
-    
     # Extract probabilities from word segments if available
-    for segment in segments:
-        for word_info in segment.get('words', []):
-            probability = word_info.get('probability', None)
-            if probability is not None:
-                probabilities.append(probability)
+    probabilities = np.fromiter(
+        (
+            word_info['probability']
+            for segment in segments
+            for word_info in segment.get('words', [])
+            if word_info.get('probability') is not None
+        ),
+        dtype=np.float64,
+    )
     
-    if not probabilities:
+    if probabilities.size == 0:
         return 0.0  # No probabilities available
     
     # Calculate mean probability
-    return sum(probabilities) / len(probabilities)
+    return float(probabilities.mean())
 
 def process_audio(audio_path, model_name="base", initial_prompt=None):
     """Process audio with Whisper and extract detailed information."""
@@ -112,6 +122,17 @@ def save_transcript_to_file(transcript, file_path):
         f.write(transcript)
     logger.info(f"Transcript saved to: {file_path}")
 
+def save_json(data, file_path):
+    """Save data as pretty-printed JSON."""
+    if orjson is not None:
+        # Whisper word timings are NumPy scalars, which orjson only encodes with OPT_SERIALIZE_NUMPY
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    logger.info(f"JSON saved to: {file_path}")
+
 def format_timestamp(seconds):
     """Format time in seconds to SRT timestamp format."""
     hours = int(seconds // 3600)
@@ -122,12 +143,13 @@ def format_timestamp(seconds):
 
 def save_srt(segments, output_path):
     """Save transcription segments in SRT format."""
+    # Build the whole file in memory and write it in one call
+    blocks = [
+        f"{i}\n{format_timestamp(segment['start'])} --> {format_timestamp(segment['end'])}\n{segment['text']}\n\n"
+        for i, segment in enumerate(segments, start=1)
+    ]
     with open(output_path, 'w', encoding='utf-8') as f:
-        for i, segment in enumerate(segments, start=1):
-            start = format_timestamp(segment['start'])
-            end = format_timestamp(segment['end'])
-            text = segment['text']
-            f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
+        f.write(''.join(blocks))
     logger.info(f"SRT file saved to: {output_path}")
 
 def update_job_status(job_id, status, response_data=None, error_message=None):
@@ -143,7 +165,7 @@ def update_job_status(job_id, status, response_data=None, error_message=None):
             'completed_at': datetime.now().isoformat() if status in ['completed', 'failed'] else None
         }
         
-        response = requests.post(url, json=payload)
+        response = HTTP_SESSION.post(url, json=payload)
         
         if response.status_code != 200:
             logger.error(f"Failed to update job status in Laravel: {response.text}")
@@ -181,7 +203,7 @@ def connectivity_test():
 def test_laravel_connectivity():
     """Test connectivity to Laravel API."""
     try:
-        response = requests.get(f"{LARAVEL_API_URL}/hello")
+        response = HTTP_SESSION.get(LARAVEL_HELLO_URL, timeout=CONNECTIVITY_TIMEOUT)
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Error connecting to Laravel API: {str(e)}")
@@ -234,8 +256,7 @@ def process_transcription():
         # Save the transcript to files
         save_transcript_to_file(transcription_result['text'], transcript_path)
         save_srt(transcription_result['segments'], srt_path)
-        with open(json_path, 'w') as f:
-            json.dump(transcription_result, f, indent=2)
+        save_json(transcription_result, json_path)
         
         # Prepare response data
         response_data = {